@@ -1,20 +1,41 @@
 """PokeAPI data collection and parsing"""
 
+import copy
 import json
 import os
 from typing import Any
 
 import requests
 
+from assignment0.cache import CacheInfo, MemoCache, normalize_key
+
 POKEAPI_BASE = "https://pokeapi.co/api/v2"
 DEFAULT_TIMEOUT = 15
 
+# In-memory tier for get_pokemon_data; one entry per Pokemon, keyed by ID with name/input aliases.
+pokemon_cache = MemoCache()
+
+# HTTP client used for requests: the requests module itself (no pooling) unless
+# a Session is installed with set_session(), e.g. once per batch worker process.
+_http: Any = requests
+
 
 class PokeAPIError(Exception):
     """Raised when PokeAPI request or parsing fails"""
     pass
 
 
+def set_session(session: requests.Session | None) -> None:
+    """Route PokeAPI requests through session (pooled connections); None restores plain requests.get."""
+    global _http
+    _http = session if session is not None else requests
+
+
+def get_session() -> requests.Session | None:
+    """Return the Session installed with set_session(), or None if using plain requests."""
+    return _http if isinstance(_http, requests.Session) else None
+
+
 def fetch_pokemon(name_or_id: str | int, timeout: int = DEFAULT_TIMEOUT) -> dict[str, Any]:
     """
     Fetch a single Pokemon by name or ID from PokeAPI.
@@ -23,7 +44,7 @@ def fetch_pokemon(name_or_id: str | int, timeout: int = DEFAULT_TIMEOUT) -> dict
     """
     url = f"{POKEAPI_BASE}/pokemon/{name_or_id}"
     try:
-        resp = requests.get(url, timeout=timeout)
+        resp = _http.get(url, timeout=timeout)
         resp.raise_for_status()
     except requests.exceptions.Timeout as e:
         raise PokeAPIError(f"Request timed out after {timeout}s") from e
@@ -90,11 +111,38 @@ def parse_pokemon_response(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def get_pokemon_data(name_or_id: str | int, timeout: int = DEFAULT_TIMEOUT) -> dict[str, Any]:
+def get_pokemon_data(
+    name_or_id: str | int, timeout: int = DEFAULT_TIMEOUT, use_cache: bool = True
+) -> dict[str, Any]:
     """
     Fetch and parse Pokemon data from PokeAPI.
 
-    Convenience function that fetches then parses.
+    Convenience function that fetches then parses. The name or ID is
+    normalized (lowercased, trimmed) before fetching. Results are memoized in
+    pokemon_cache (name and ID lookups share an entry); pass use_cache=False
+    to bypass it.
     """
-    raw = fetch_pokemon(name_or_id, timeout=timeout)
-    return parse_pokemon_response(raw)
+    key = normalize_key(name_or_id)
+    if use_cache:
+        found, cached = pokemon_cache.get(key)
+        if found:
+            return copy.deepcopy(cached)
+
+    raw = fetch_pokemon(key, timeout=timeout)
+    data = parse_pokemon_response(raw)
+
+    if use_cache:
+        aliases = {normalize_key(a) for a in (key, data.get("name"), data.get("id")) if a is not None}
+        canonical = normalize_key(data["id"]) if data.get("id") is not None else key
+        pokemon_cache.set(canonical, copy.deepcopy(data), aliases=aliases)
+    return data
+
+
+def cache_info() -> CacheInfo:
+    """Hit/miss statistics for the get_pokemon_data memo cache."""
+    return pokemon_cache.info()
+
+
+def cache_clear() -> None:
+    """Empty the get_pokemon_data memo cache."""
+    pokemon_cache.clear()
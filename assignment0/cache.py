@@ -0,0 +1,109 @@
+"""In-process LRU memoization tier for API and LLM results."""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "ttl"])
+
+DEFAULT_MAXSIZE = 256
+
+
+def normalize_key(name_or_id: str | int) -> str:
+    """Canonical cache key for a Pokemon name or ID ("Pikachu ", "025" -> "pikachu", "25")."""
+    key = str(name_or_id).strip().lower()
+    if key.isdecimal():
+        key = str(int(key))
+    return key
+
+
+class MemoCache:
+    """
+    Size-bounded LRU cache with optional TTL (seconds).
+
+    Thread-safe. maxsize=0 disables caching; ttl=None or ttl <= 0 means entries
+    never expire. Expiry is checked against the current ttl on every lookup,
+    so changing ttl via configure() also applies to entries already stored.
+    An entry may have aliases (other keys that resolve to it); aliases do not
+    count toward maxsize and are evicted together with their entry.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None):
+        self._data: OrderedDict[Hashable, tuple[float, Any, set[Hashable]]] = OrderedDict()
+        self._aliases: dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.ttl = ttl if ttl is not None and ttl > 0 else None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (found, value), refreshing the entry's LRU position on a hit."""
+        with self._lock:
+            key = self._aliases.get(key, key)
+            entry = self._data.get(key)
+            if entry is not None:
+                stored_at, value, _ = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                self._drop(key)
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, aliases: Iterable[Hashable] = ()) -> None:
+        """Store value under key (and aliases), evicting least recently used entries past maxsize."""
+        if self.maxsize <= 0:
+            return
+        stored_at = time.monotonic()
+        names = {a for a in aliases if a != key}
+        with self._lock:
+            for k in names | {key}:
+                if k in self._data:
+                    self._drop(k)
+                elif k in self._aliases:
+                    self._data[self._aliases.pop(k)][2].discard(k)
+            self._data[key] = (stored_at, value, names)
+            for alias in names:
+                self._aliases[alias] = key
+            self._evict(self.maxsize)
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove an entry and its aliases. Caller holds the lock."""
+        _, _, names = self._data.pop(key)
+        for alias in names:
+            self._aliases.pop(alias, None)
+
+    def _evict(self, maxsize: int) -> None:
+        """Drop least recently used entries until at most maxsize remain. Caller holds the lock."""
+        while len(self._data) > max(maxsize, 0):
+            self._drop(next(iter(self._data)))
+
+    def configure(self, maxsize: int | None = None, ttl: float | None = None) -> None:
+        """
+        Change maxsize and/or ttl (ttl <= 0 removes expiry, as in __init__).
+
+        Shrinking maxsize evicts immediately; a new ttl applies to existing entries too.
+        """
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if ttl is not None:
+                self.ttl = ttl if ttl > 0 else None
+            self._evict(self.maxsize)
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self._aliases.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss statistics, like functools.lru_cache's cache_info()."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data), self.ttl)
@@ -2,7 +2,12 @@
 
 import argparse
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 
+import requests
+
+from assignment0 import api, llm
 from assignment0.api import PokeAPIError, get_pokemon_data
 from assignment0.llm import NavigatorAIError, summarize_with_navigator
 
@@ -35,7 +40,7 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "pokemon",
         nargs="?",
-        default="pikachu",
+        default=None,
         help="Pokemon name or ID (default: pikachu)",
     )
     parser.add_argument(
@@ -50,7 +55,128 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         metavar="SECS",
         help="Request timeout in seconds (default: 15)",
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Process every Pokemon name or ID listed in FILE (one per line) instead of the positional one",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of worker processes for --batch runs (default: 1, run in-process)",
+    )
+    parsed = parser.parse_args(args)
+
+    if parsed.batch is not None and parsed.pokemon is not None:
+        parser.error("a positional pokemon cannot be combined with --batch")
+    if parsed.workers is not None and parsed.batch is None:
+        parser.error("--workers requires --batch")
+    if parsed.workers is not None and parsed.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if parsed.pokemon is None:
+        parsed.pokemon = "pikachu"
+    if parsed.workers is None:
+        parsed.workers = 1
+    return parsed
+
+
+def read_batch_file(path: str) -> list[str]:
+    """Read Pokemon names/IDs from a file, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def _format_result(data: dict, summary: str | None = None) -> str:
+    """Format one Pokemon (and optional summary) with the same layout main() prints."""
+    text = format_pokemon_display(data) + "\n"
+    if summary is not None:
+        text += "\n--- AI Summary (NaviGator) ---\n" + summary
+    return text
+
+
+def _init_worker(pokeapi_base: str, navigator_base: str) -> None:
+    """
+    Set up a batch worker process: the parent's API base URLs and its own
+    pooled HTTP session. Base URLs are passed explicitly so workers match the
+    parent under any multiprocessing start method (fork, spawn, forkserver).
+    """
+    api.POKEAPI_BASE = pokeapi_base
+    llm.NAVIGATOR_BASE = navigator_base
+    session = requests.Session()
+    api.set_session(session)
+    llm.set_session(session)
+
+
+def _process_one(name_or_id: str, timeout: int, no_llm: bool) -> tuple[str, str | None]:
+    """
+    Fetch (and optionally summarize) one Pokemon for a batch run.
+
+    Returns (output text, error message or None). Runs inside worker processes,
+    so it never prints; the parent process is the only writer. Any exception is
+    reported as this item's error so one bad entry cannot abort the batch.
+    """
+    try:
+        data = get_pokemon_data(name_or_id, timeout=timeout)
+    except PokeAPIError as e:
+        return "", f"{name_or_id}: PokeAPI error: {e}"
+    except Exception as e:
+        return "", f"{name_or_id}: unexpected error: {type(e).__name__}: {e}"
+
+    if no_llm:
+        return _format_result(data), None
+
+    try:
+        summary = summarize_with_navigator(data, timeout=60)
+    except NavigatorAIError as e:
+        return _format_result(data), f"{name_or_id}: NaviGator AI error: {e}"
+    except Exception as e:
+        return _format_result(data), f"{name_or_id}: unexpected error: {type(e).__name__}: {e}"
+    return _format_result(data, summary), None
+
+
+def run_batch(ids: list[str], timeout: int, no_llm: bool, workers: int = 1) -> int:
+    """
+    Process many Pokemon, optionally across a pool of worker processes.
+
+    With workers > 1, IDs are handed out in small chunks (about four per
+    worker) as workers become free; results are still printed in input order
+    by this process. Returns 1 if any item failed, else 0.
+    """
+    n = len(ids)
+    if workers <= 1 or n <= 1:
+        prev_api, prev_llm = api.get_session(), llm.get_session()
+        with requests.Session() as session:
+            api.set_session(prev_api or session)
+            llm.set_session(prev_llm or session)
+            try:
+                return _write_results(_process_one(i, timeout, no_llm) for i in ids)
+            finally:
+                api.set_session(prev_api)
+                llm.set_session(prev_llm)
+
+    chunksize = max(1, n // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(api.POKEAPI_BASE, llm.NAVIGATOR_BASE),
+    ) as pool:
+        results = pool.map(_process_one, ids, [timeout] * n, [no_llm] * n, chunksize=chunksize)
+        return _write_results(results)
+
+
+def _write_results(results: Iterable[tuple[str, str | None]]) -> int:
+    """Print batch results in order; errors go to stderr."""
+    exit_code = 0
+    for out, err in results:
+        if out:
+            print(out)
+        if err:
+            print(err, file=sys.stderr)
+            exit_code = 1
+    return exit_code
 
 
 def main(args: list[str] | None = None) -> int:
@@ -61,6 +187,14 @@ def main(args: list[str] | None = None) -> int:
         print("Only 'pokeapi' source is supported.", file=sys.stderr)
         return 1
 
+    if parsed.batch:
+        try:
+            ids = read_batch_file(parsed.batch)
+        except OSError as e:
+            print(f"Could not read batch file: {e}", file=sys.stderr)
+            return 1
+        return run_batch(ids, parsed.timeout, parsed.no_llm, workers=parsed.workers)
+
     try:
         data = get_pokemon_data(parsed.pokemon, timeout=parsed.timeout)
     except PokeAPIError as e:
@@ -8,6 +8,8 @@ from typing import Any
 import requests
 from dotenv import load_dotenv
 
+from assignment0.cache import CacheInfo, MemoCache
+
 # Load .env from project root (parent of assignment0 package) or current working directory
 _load_dotenv_done = False
 
@@ -34,6 +36,12 @@ NAVIGATOR_BASE = "https://api.ai.it.ufl.edu/v1"
 NAVIGATOR_MODEL = "llama-3.1-8b-instruct"
 DEFAULT_TIMEOUT = 60
 
+# In-memory tier for summarize_with_navigator, keyed by model + canonical JSON of the data.
+summary_cache = MemoCache()
+
+# HTTP client for NaviGator calls; see set_session().
+_http: Any = requests
+
 
 class NavigatorAIError(Exception):
     """Raised when NaviGator AI request or response fails."""
@@ -41,6 +49,17 @@ class NavigatorAIError(Exception):
     pass
 
 
+def set_session(session: requests.Session | None) -> None:
+    """Route NaviGator requests through session (pooled connections); None restores plain requests.post."""
+    global _http
+    _http = session if session is not None else requests
+
+
+def get_session() -> requests.Session | None:
+    """Return the Session installed with set_session(), or None if using plain requests."""
+    return _http if isinstance(_http, requests.Session) else None
+
+
 def _get_api_key() -> str:
     """Get NaviGator API key from environment or .env file. Never hardcode."""
     _load_env()
@@ -67,12 +86,45 @@ def _build_prompt(pokemon_data: dict[str, Any]) -> str:
     )
 
 
-def summarize_with_navigator(pokemon_data: dict[str, Any], timeout: int = DEFAULT_TIMEOUT) -> str:
+def _summary_key(pokemon_data: dict[str, Any]) -> str:
+    """Canonical cache key: same data in any key order maps to the same entry."""
+    return NAVIGATOR_MODEL + ":" + json.dumps(pokemon_data, sort_keys=True, default=str)
+
+
+def summarize_with_navigator(
+    pokemon_data: dict[str, Any], timeout: int = DEFAULT_TIMEOUT, use_cache: bool = True
+) -> str:
     """
     Send Pokemon data to NaviGator AI and return a summary/analysis.
 
     Uses chat completions endpoint. Handles missing key and API errors.
+    Successful summaries are memoized in summary_cache; pass use_cache=False
+    to bypass it.
     """
+    key = _summary_key(pokemon_data)
+    if use_cache:
+        found, cached = summary_cache.get(key)
+        if found:
+            return cached
+
+    summary = _request_summary(pokemon_data, timeout)
+    if use_cache:
+        summary_cache.set(key, summary)
+    return summary
+
+
+def cache_info() -> CacheInfo:
+    """Hit/miss statistics for the summarize_with_navigator memo cache."""
+    return summary_cache.info()
+
+
+def cache_clear() -> None:
+    """Empty the summarize_with_navigator memo cache."""
+    summary_cache.clear()
+
+
+def _request_summary(pokemon_data: dict[str, Any], timeout: int) -> str:
+    """Call the NaviGator chat completions endpoint and extract the reply text."""
     api_key = _get_api_key()
     url = f"{NAVIGATOR_BASE}/chat/completions"
     payload = {
@@ -88,7 +140,7 @@ def summarize_with_navigator(pokemon_data: dict[str, Any], timeout: int = DEFAUL
     }
 
     try:
-        resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
+        resp = _http.post(url, json=payload, headers=headers, timeout=timeout)
         resp.raise_for_status()
     except requests.exceptions.Timeout as e:
         raise NavigatorAIError(f"NaviGator request timed out after {timeout}s") from e
@@ -0,0 +1,57 @@
+"""Benchmark --batch throughput with 1 vs N worker processes against the local stub.
+
+Not collected by pytest. Run from the project root:
+
+    python -m tests.bench_batch [--ids 300] [--workers 4] [--pad 2000]
+
+Each stub response carries --pad fake moves, so every item costs real JSON
+decoding and parsing on the client side.
+"""
+
+import argparse
+import io
+import os
+import time
+from contextlib import redirect_stdout
+
+from assignment0 import api
+from assignment0.cli import run_batch
+from tests.stub_pokeapi import start_stub
+
+
+def time_run(ids: list[str], workers: int) -> float:
+    """Run one cold-cache batch and return elapsed seconds."""
+    api.cache_clear()
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        exit_code = run_batch(ids, timeout=15, no_llm=True, workers=workers)
+    elapsed = time.perf_counter() - start
+    if exit_code != 0:
+        raise SystemExit(f"batch with {workers} worker(s) reported errors")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=300, help="Number of IDs (default: 300)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Workers to compare against 1")
+    parser.add_argument("--pad", type=int, default=2000, help="Fake moves per response (default: 2000)")
+    opts = parser.parse_args()
+
+    proc, base = start_stub(pad=opts.pad)
+    api.POKEAPI_BASE = base
+    ids = [str(i) for i in range(1, opts.ids + 1)]
+    try:
+        one = time_run(ids, 1)
+        many = time_run(ids, opts.workers)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print(f"cpus={os.cpu_count()} ids={opts.ids} pad={opts.pad}")
+    print(f"workers=1: {one:.2f}s")
+    print(f"workers={opts.workers}: {many:.2f}s ({one / many:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from assignment0 import api, llm
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_state():
+    """Memo caches and HTTP sessions are process-global; start every test clean."""
+    api.cache_clear()
+    llm.cache_clear()
+    yield
+    api.cache_clear()
+    llm.cache_clear()
+    api.set_session(None)
+    llm.set_session(None)
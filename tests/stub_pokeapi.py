@@ -0,0 +1,72 @@
+"""Local PokeAPI stub server for batch tests and benchmarks.
+
+Run as a subprocess: python -m tests.stub_pokeapi [--pad N]
+Prints the base URL on the first line of stdout, then serves until killed.
+'missingno' returns 404; other names/IDs return a minimal Pokemon, padded with
+N fake moves so clients do real JSON decoding work per item.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+def make_handler(pad: int):
+    """Build a request handler class whose responses carry pad fake moves."""
+    moves = [{"move": {"name": f"move-{i}", "url": f"https://example.invalid/move/{i}"}} for i in range(pad)]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            name = self.path.rsplit("/", 1)[-1]
+            if name == "missingno":
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = json.dumps({
+                "name": f"mon-{name}",
+                "id": int(name) if name.isdigit() else 0,
+                "types": [{"type": {"name": "normal"}}],
+                "stats": [{"stat": {"name": "hp"}, "base_stat": 50}],
+                "moves": moves,
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_stub(pad: int = 0) -> tuple[subprocess.Popen, str]:
+    """Start the stub in a subprocess; returns (process, base_url). Caller must terminate it."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "tests.stub_pokeapi", "--pad", str(pad)],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    base_url = proc.stdout.readline().strip()
+    return proc, base_url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pad", type=int, default=0, help="Fake moves per response (default: 0)")
+    pad = parser.parse_args().pad
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(pad))
+    print(f"http://127.0.0.1:{server.server_port}/api/v2", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
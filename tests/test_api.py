@@ -120,3 +120,48 @@ def test_get_pokemon_data_calls_fetch_and_parse():
     mock_fetch.assert_called_once_with("ditto", timeout=15)
     assert data["name"] == "ditto"
     assert data["id"] == 132
+
+
+def test_get_pokemon_data_memoized_with_aliases():
+    """Second lookup by name, case variant, or ID hits the cache. Mocks PokeAPI; no live call."""
+    from assignment0.api import cache_info
+
+    mock_raw = {"name": "pikachu", "id": 25}
+
+    with patch("assignment0.api.fetch_pokemon") as mock_fetch:
+        mock_fetch.return_value = mock_raw
+        first = get_pokemon_data("Pikachu")
+        first["types"].append("mutated")
+        assert get_pokemon_data("pikachu")["types"] == ["unknown"]
+        assert get_pokemon_data(25)["name"] == "pikachu"
+
+    mock_fetch.assert_called_once_with("pikachu", timeout=15)
+    assert cache_info().hits == 2
+    assert cache_info().currsize == 1
+
+
+def test_get_pokemon_data_bypass_and_clear():
+    """use_cache=False and cache_clear() force a refetch. Mocks PokeAPI; no live call."""
+    from assignment0.api import cache_clear
+
+    with patch("assignment0.api.fetch_pokemon") as mock_fetch:
+        mock_fetch.return_value = {"name": "ditto", "id": 132}
+        get_pokemon_data("ditto")
+        get_pokemon_data("ditto", use_cache=False)
+        cache_clear()
+        get_pokemon_data("ditto")
+
+    assert mock_fetch.call_count == 3
+
+
+def test_get_pokemon_data_fetch_url_normalized():
+    """On a cold cache, the request URL uses the lowercased name. Mocks PokeAPI; no live call."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"name": "pikachu", "id": 25}
+    mock_response.raise_for_status = MagicMock()
+
+    with patch("assignment0.api.requests.get") as mock_get:
+        mock_get.return_value = mock_response
+        get_pokemon_data(" Pikachu ")
+
+    assert mock_get.call_args[0][0].endswith("/pokemon/pikachu")
@@ -0,0 +1,102 @@
+"""Tests for cache module."""
+
+from unittest.mock import patch
+
+from assignment0.cache import MemoCache, normalize_key
+
+
+def test_normalize_key():
+    """Names are case/whitespace-insensitive; numeric IDs drop leading zeros."""
+    assert normalize_key(" Pikachu ") == "pikachu"
+    assert normalize_key("025") == "25"
+    assert normalize_key(25) == "25"
+    assert normalize_key("²") == "²"
+
+
+def test_memo_cache_lru_eviction():
+    """Least recently used entry is evicted past maxsize."""
+    cache = MemoCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+
+
+def test_memo_cache_ttl_expiry():
+    """Entries expire after ttl seconds."""
+    cache = MemoCache(ttl=10)
+    with patch("assignment0.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("assignment0.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == (True, 1)
+    with patch("assignment0.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") == (False, None)
+    assert cache.info().currsize == 0
+
+
+def test_memo_cache_info_and_clear():
+    """info() reports hits/misses/size; clear() resets them."""
+    cache = MemoCache(maxsize=4)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 4, 1)
+    cache.clear()
+    assert cache.info()[:4] == (0, 0, 4, 0)
+
+
+def test_memo_cache_disabled_and_configure():
+    """maxsize=0 stores nothing; shrinking via configure evicts oldest; ttl=0 means no expiry."""
+    cache = MemoCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") == (False, None)
+    cache.configure(maxsize=3)
+    for k in "abc":
+        cache.set(k, k)
+    cache.configure(maxsize=1)
+    assert cache.info().currsize == 1
+    assert cache.get("c") == (True, "c")
+    assert MemoCache(ttl=0).info().ttl is None
+    cache.configure(ttl=0)
+    assert cache.info().ttl is None
+
+
+def test_memo_cache_ttl_zero_means_no_expiry():
+    """ttl <= 0 disables expiry both in the constructor and in configure()."""
+    for cache in (MemoCache(ttl=0), MemoCache(ttl=5)):
+        cache.configure(ttl=0)
+        with patch("assignment0.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("assignment0.cache.time.monotonic", return_value=1e9):
+            assert cache.get("a") == (True, 1)
+        assert cache.info().ttl is None
+
+
+def test_memo_cache_configure_ttl_applies_to_existing_entries():
+    """Setting a ttl after warm-up expires entries stored earlier."""
+    cache = MemoCache()
+    with patch("assignment0.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    cache.configure(ttl=10)
+    with patch("assignment0.cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == (True, 1)
+    with patch("assignment0.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") == (False, None)
+
+
+def test_memo_cache_aliases_share_one_entry():
+    """Aliases resolve to one entry, don't count toward size, and are evicted with it."""
+    cache = MemoCache(maxsize=1)
+    cache.set("25", "pika", aliases=["pikachu", "25"])
+    assert cache.info().currsize == 1
+    assert cache.get("pikachu") == (True, "pika")
+    assert cache.get("25") == (True, "pika")
+    cache.set("1", "bulba", aliases=["bulbasaur"])
+    assert cache.get("pikachu") == (False, None)
+    assert cache.get("25") == (False, None)
+    assert cache.get("bulbasaur") == (True, "bulba")
+    assert cache.info().currsize == 1
@@ -1,12 +1,16 @@
 """Tests for CLI. Mock external APIs; do not call live APIs."""
 
+import functools
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from assignment0.cli import format_pokemon_display, main, parse_args
+from assignment0.cli import format_pokemon_display, main, parse_args, run_batch
+from tests.stub_pokeapi import start_stub
 
 
 def test_parse_args_defaults():
@@ -132,3 +136,142 @@ def test_main_api_error_returns_1():
 
     assert exit_code == 1
     mock_fetch.assert_called_once()
+
+
+def test_parse_args_batch_and_workers():
+    """--batch and --workers are parsed; workers defaults to 1."""
+    assert parse_args([]).workers == 1
+    args = parse_args(["--batch", "ids.txt", "--workers", "4"])
+    assert args.batch == "ids.txt"
+    assert args.workers == 4
+
+
+def test_main_batch_in_order(tmp_path):
+    """Batch run prints results in input order and reports failures. Mocks PokeAPI; no live calls."""
+    from assignment0.api import PokeAPIError
+
+    batch = tmp_path / "ids.txt"
+    batch.write_text("bulbasaur\n# comment\n\n404\nsquirtle\n")
+
+    def fake_get(name_or_id, timeout=15):
+        if name_or_id == "404":
+            raise PokeAPIError("Not found")
+        return {"name": name_or_id, "id": 1, "types": [], "abilities": [], "stats": {}}
+
+    with patch("assignment0.cli.get_pokemon_data", side_effect=fake_get) as mock_fetch:
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            with patch("sys.stderr", new_callable=StringIO) as stderr:
+                exit_code = main(["--no-llm", "--batch", str(batch)])
+
+    assert exit_code == 1
+    assert mock_fetch.call_count == 3
+    out = stdout.getvalue()
+    assert out.index("bulbasaur") < out.index("squirtle")
+    assert "404: PokeAPI error" in stderr.getvalue()
+
+
+@pytest.mark.parametrize("start_method", multiprocessing.get_all_start_methods())
+def test_main_batch_with_worker_processes(tmp_path, monkeypatch, start_method):
+    """--workers 2 runs real processes (any start method) against a stub server; output stays in input order."""
+    proc, base = start_stub()
+    monkeypatch.setattr("assignment0.api.POKEAPI_BASE", base)
+    monkeypatch.setattr(
+        "assignment0.cli.ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context(start_method)),
+    )
+    ids = [str(i) for i in range(1, 41)]
+    batch = tmp_path / "ids.txt"
+    batch.write_text("\n".join(ids[:20] + ["missingno"] + ids[20:]))
+
+    try:
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            with patch("sys.stderr", new_callable=StringIO) as stderr:
+                exit_code = main(["--no-llm", "--batch", str(batch), "--workers", "2"])
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    assert exit_code == 1
+    assert "missingno: PokeAPI error: HTTP error 404" in stderr.getvalue()
+    names = [line.split()[1] for line in stdout.getvalue().splitlines() if line.startswith("Name:")]
+    assert names == [f"mon-{i}" for i in ids]
+
+
+def test_run_batch_continues_after_unexpected_error():
+    """An unexpected exception on one item is reported and the batch continues. Mocks PokeAPI."""
+    def fake_get(name_or_id, timeout=15):
+        if name_or_id == "bad":
+            raise AttributeError("'list' object has no attribute 'get'")
+        return {"name": name_or_id, "id": 1}
+
+    with patch("assignment0.cli.get_pokemon_data", side_effect=fake_get):
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            with patch("sys.stderr", new_callable=StringIO) as stderr:
+                exit_code = run_batch(["a", "bad", "c"], timeout=5, no_llm=True)
+
+    assert exit_code == 1
+    assert "Name: a " in stdout.getvalue() and "Name: c " in stdout.getvalue()
+    assert "bad: unexpected error: AttributeError" in stderr.getvalue()
+
+
+def test_run_batch_keeps_caller_session():
+    """In-process batch uses and then restores a session installed by the caller."""
+    import requests
+
+    from assignment0 import api, llm
+
+    session = requests.Session()
+    api.set_session(session)
+    with patch("assignment0.cli.get_pokemon_data", return_value={"name": "a", "id": 1}):
+        with patch("sys.stdout", new_callable=StringIO):
+            run_batch(["a"], timeout=5, no_llm=True)
+
+    assert api.get_session() is session
+    assert llm.get_session() is None
+
+
+def test_batch_output_matches_single_mode(tmp_path):
+    """Batch output for one Pokemon is identical to single mode. Mocks APIs; no live calls."""
+    data = {"name": "eevee", "id": 133, "types": ["normal"], "abilities": [], "stats": {}}
+    batch = tmp_path / "ids.txt"
+    batch.write_text("eevee\n")
+
+    outputs = []
+    for argv in (["eevee"], ["--batch", str(batch)]):
+        with patch("assignment0.cli.get_pokemon_data", return_value=data):
+            with patch("assignment0.cli.summarize_with_navigator", return_value="Versatile."):
+                with patch("sys.stdout", new_callable=StringIO) as stdout:
+                    assert main(argv) == 0
+        outputs.append(stdout.getvalue())
+
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--workers", "0", "--batch", "ids.txt"],
+        ["--workers", "2"],
+        ["--batch", "ids.txt", "pikachu"],
+    ],
+)
+def test_parse_args_batch_conflicts(argv):
+    """Invalid --workers, --workers without --batch, and --batch with a positional are rejected."""
+    with patch("sys.stderr", new_callable=StringIO):
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(argv)
+    assert exc_info.value.code == 2
+
+
+def test_init_worker_installs_session():
+    """Each worker process gets a pooled requests.Session for both APIs."""
+    import requests
+
+    from assignment0 import api, llm
+    from assignment0.cli import _init_worker
+
+    _init_worker("http://stub/api/v2", "http://stub/v1")
+    assert isinstance(api.get_session(), requests.Session)
+    assert llm.get_session() is api.get_session()
+    assert api.POKEAPI_BASE == "http://stub/api/v2"
+    assert llm.NAVIGATOR_BASE == "http://stub/v1"
@@ -104,3 +104,19 @@ def test_summarize_with_navigator_empty_choices():
             with pytest.raises(NavigatorAIError, match="no choices"):
                 summarize_with_navigator({"name": "pikachu"})
     mock_post.assert_called_once()
+
+
+def test_summarize_with_navigator_memoized():
+    """Same data (any key order) reuses the summary; use_cache=False refetches. Mocks API; no live call."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"choices": [{"message": {"content": "Cached."}}]}
+    mock_response.raise_for_status = MagicMock()
+
+    with patch("assignment0.llm.requests.post") as mock_post:
+        with patch("assignment0.llm._get_api_key", return_value="fake-key"):
+            mock_post.return_value = mock_response
+            assert summarize_with_navigator({"name": "pikachu", "id": 25}) == "Cached."
+            assert summarize_with_navigator({"id": 25, "name": "pikachu"}) == "Cached."
+            assert mock_post.call_count == 1
+            summarize_with_navigator({"name": "pikachu", "id": 25}, use_cache=False)
+            assert mock_post.call_count == 2